@@ -478,10 +478,10 @@ class PsyscaleCore:
 
     def _ensure_std_schemas_exist(self):
         with self._cursor() as cursor:
-            cursor.execute(self[Op.SELECT, GenericTbls.SCHEMA]())
-            schemas: set[str] = {rsp[0] for rsp in cursor.fetchall()}
+            # Only the missing schema names are returned
+            cursor.execute(self[Op.SELECT, GenericTbls.SCHEMA]([v for v in Schema]))
 
-            for schema in {v for v in Schema}.difference(schemas):
+            for (schema,) in cursor.fetchall():
                 log.info("Creating Schema %s", schema)
                 cursor.execute(self[Op.CREATE, GenericTbls.SCHEMA](schema))
 
@@ -1,9 +1,10 @@
 "Metadata Partial Class Functions"
 
 import logging
-from typing import Any
+from typing import Any, Optional, Sequence
 
 from pandas import Timedelta, Timestamp
+from psycopg import sql
 from psyscale.core import TupleCursor
 from psyscale.timeseries_partial import TimeseriesPartialAbstract
 
@@ -21,6 +22,12 @@ from .psql import (
 
 log = logging.getLogger("psyscale_log")
 
+# Start & End date given to metadata of tables that should be, but are not yet, stored.
+DEFAULT_MDATA_DATE = Timestamp("1800-01-01", tz="UTC")
+
+# Filter matching every pkey in the 'pkeys' array argument
+PKEYS_FILTER = sql.SQL("pkey = ANY({pkeys})").format(pkeys=sql.Placeholder("pkeys"))
+
 # pylint: disable='protected-access','abstract-method'
 
 
@@ -123,6 +130,68 @@ class MetadataPartial(TimeseriesPartialAbstract):
         else:
             return _fetch_stored_metadata(self, pkey, filters)
 
+    def stored_metadata_bulk(
+        self, pkeys: Sequence[int], *, _all: bool = False
+    ) -> dict[int, list[MetadataInfo]]:
+        """
+        Return Metadata about the series data stored for many symbols, keyed by primary key.
+        Results match calling stored_metadata(pkey, _all=_all) for each pkey, but the database is
+        queried at most twice in total rather than once or twice per symbol.
+
+        Pkeys that are unknown, or not set to be stored when _all=True, map to an empty list.
+        """
+        metadata: dict[int, list[MetadataInfo]] = {pkey: [] for pkey in pkeys}
+        if len(metadata) == 0:
+            return metadata
+        pkey_args = {"pkeys": list(metadata.keys())}
+        # Fixed column order so the response can be unpacked by position
+        _rtn_args = ["pkey", "asset_class", "store_tick", "store_minute", "store_aggregate"]
+
+        with self._cursor(dict_cursor=True) as cursor:
+            cursor.execute(
+                self[Op.SELECT, AssetTbls._METADATA]([PKEYS_FILTER]), pkey_args
+            )
+            for row in cursor.fetchall():
+                metadata[row["pkey"]].append(MetadataInfo(**row))
+
+        if not _all:
+            return metadata
+
+        symbols = []  # _cursor() silences Database Errors, leaving this unassigned.
+        with self._cursor() as cursor:
+            cursor.execute(
+                self[Op.SELECT, GenericTbls.TABLE](
+                    Schema.SECURITY,
+                    AssetTbls.SYMBOLS,
+                    _rtn_args,
+                    PKEYS_FILTER,
+                ),
+                pkey_args,
+            )
+            symbols = cursor.fetchall()
+
+        for pkey, asset_class, store_tick, store_minute, store_aggregate in symbols:
+            schema = _storage_schema(store_tick, store_minute, store_aggregate)
+            if schema is None:
+                log.warning(
+                    "Requested metadata for Symbol w/ pkey %s, but it is not set to be stored.",
+                    pkey,
+                )
+                metadata[pkey] = []  # Match stored_metadata(_all=True)
+                continue
+
+            try:
+                req_tables = self._table_config[schema].raw_tables(asset_class)
+            except KeyError as e:
+                raise KeyError(  # Reraise a more informative error.
+                    "Ensure configure_timeseries_schema has been run prior to inserting symbol data."
+                ) from e
+            metadata[pkey].extend(
+                _missing_metadata(pkey, metadata[pkey], req_tables, schema)
+            )
+
+        return metadata
+
     def manually_refresh_aggregate_metadata(self):
         """
         CLI Script to Manually Refresh Continuous Aggregates as needed.
@@ -191,9 +260,7 @@ class MetadataPartial(TimeseriesPartialAbstract):
                     if rsp.lower() != "y":
                         continue
 
-                aggs = config.all_tables(asset_class, include_raw=False)
-                aggs.sort(key=lambda x: x.period)
-                all_aggregates.extend(aggs)
+                all_aggregates.extend(config.sorted_aggregates(asset_class))
 
             for table in all_aggregates:
                 if method == "table":
@@ -234,32 +301,26 @@ def _fetch_all_metadata(db: MetadataPartial, pkey: int) -> list[MetadataInfo]:
     data for the symbol.
     """
 
+    # Fixed column order so the response can be unpacked by position
     _rtn_args = ["asset_class", "store_tick", "store_minute", "store_aggregate"]
     _filter = ("pkey", "=", pkey)
 
     rsp, _ = db.execute(
         db[Op.SELECT, GenericTbls.TABLE](
             Schema.SECURITY, AssetTbls.SYMBOLS, _rtn_args, _filter
-        ),
-        dict_cursor=True,
+        )
     )
     if len(rsp) == 0:
         raise ValueError(
             f"Cannot determine Symbol updates needed. {pkey = } is unknown."
         )
-    rsp = rsp[0]
-    asset_class = rsp["asset_class"]
+    asset_class, store_tick, store_minute, store_aggregate = rsp[0]
 
-    # A Symbol can only be stored in one schema at a time
-    if rsp["store_tick"]:
-        schema = Schema.TICK_DATA
-    elif rsp["store_minute"]:
-        schema = Schema.MINUTE_DATA
-    elif rsp["store_aggregate"]:
-        schema = Schema.AGGREGATE_DATA
-    else:
+    schema = _storage_schema(store_tick, store_minute, store_aggregate)
+    if schema is None:
         log.warning(
-            "Requested metadata for Symbol w/ pkey %s, but it is not set to be stored."
+            "Requested metadata for Symbol w/ pkey %s, but it is not set to be stored.",
+            pkey,
         )
         return []
 
@@ -275,6 +336,20 @@ def _fetch_all_metadata(db: MetadataPartial, pkey: int) -> list[MetadataInfo]:
     return metadata
 
 
+def _storage_schema(
+    store_tick: bool, store_minute: bool, store_aggregate: bool
+) -> Optional[Schema]:
+    "The Schema a symbol's series data is stored in, None if it is not set to be stored."
+    # A Symbol can only be stored in one schema at a time
+    if store_tick:
+        return Schema.TICK_DATA
+    if store_minute:
+        return Schema.MINUTE_DATA
+    if store_aggregate:
+        return Schema.AGGREGATE_DATA
+    return None
+
+
 def _missing_metadata(
     pkey: int,
     stored_metadata: list[MetadataInfo],
@@ -282,18 +357,18 @@ def _missing_metadata(
     schema: Schema,
 ) -> list[MetadataInfo]:
     "Determines what metadata is missing, if any, given a list of required tables"
-    stored_tables = [mdata.table for mdata in stored_metadata]
-    # As long as the hash of an AssetTable is a string this will work.
-    missing_tables = set(req_tables).difference(stored_tables)
-    missing_metadata = [
+    # AssetTables are equal when their names are. Compare by name since AssetTable.__hash__
+    # rebuilds an integer every call while str hashes are cached by python.
+    stored_tables = {mdata.table_name for mdata in stored_metadata}
+    return [
         MetadataInfo(
             pkey,
             table.table_name,
             schema,
-            Timestamp("1800-01-01", tz="UTC"),  # Default values
-            Timestamp("1800-01-01", tz="UTC"),
+            DEFAULT_MDATA_DATE,
+            DEFAULT_MDATA_DATE,
             table,
         )
-        for table in missing_tables
+        for table in req_tables
+        if table.table_name not in stored_tables
     ]
-    return missing_metadata
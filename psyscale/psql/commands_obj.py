@@ -98,12 +98,14 @@ OPERATION_MAP: OperationMap = {
     Operation.INSERT: {
         SeriesTbls.TICK_BUFFER: ts.insert_copied_ticks,
         SeriesTbls.RAW_AGG_BUFFER: ts.insert_copied_aggregates,
+        AssetTbls.SYMBOLS: sec.insert_symbols,
         AssetTbls.SYMBOLS_BUFFER: sec.insert_copied_symbols,
         SeriesTbls._ORIGIN: ts.insert_origin,
     },
     Operation.UPSERT: {
         SeriesTbls.TICK_BUFFER: ts.upsert_copied_ticks,
         SeriesTbls.RAW_AGG_BUFFER: ts.upsert_copied_aggregates,
+        AssetTbls.SYMBOLS: sec.upsert_symbols,
         AssetTbls.SYMBOLS_BUFFER: sec.upsert_copied_symbols,
     },
     Operation.UPDATE: {
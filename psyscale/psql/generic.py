@@ -123,8 +123,16 @@ def filter_composer(
 # region -------- -------- Generic PSQL Commands -------- --------
 
 
-def list_schemas() -> sql.Composed:
-    return sql.SQL("SELECT schema_name FROM information_schema.schemata;").format()
+def list_schemas(only_missing_of: Optional[Sequence[str]] = None) -> sql.Composed:
+    "List all schemas, or when given a list of schema names, only those that don't exist yet."
+    if only_missing_of is None:
+        return sql.SQL("SELECT schema_name FROM information_schema.schemata;").format()
+    return sql.SQL(
+        "SELECT _name FROM unnest(ARRAY[{names}]::text[]) AS _name "
+        "WHERE _name NOT IN (SELECT schema_name FROM information_schema.schemata);"
+    ).format(
+        names=sql.SQL(", ").join(sql.Literal(name) for name in only_missing_of),
+    )
 
 
 def list_mat_views(schema: str) -> sql.Composed:
@@ -135,11 +143,14 @@ def list_mat_views(schema: str) -> sql.Composed:
     )
 
 
-def list_tables(schema: str) -> sql.Composed:
+def list_tables(schema: str, table: Optional[str] = None) -> sql.Composed:
+    "List all tables in a schema, or when given a table name, only that table if it exists."
     return sql.SQL(
-        "SELECT table_name FROM information_schema.tables WHERE table_schema = {schema_name};"
+        "SELECT table_name FROM information_schema.tables WHERE table_schema = {schema_name}"
+        + (" AND table_name = {table_name};" if table is not None else ";")
     ).format(
         schema_name=sql.Literal(schema),
+        table_name=sql.Literal(table),
     )
 
 
@@ -21,6 +21,7 @@ from pandas import Timedelta, Timestamp
 
 DEFAULT_ORIGIN_DATE = Timestamp("2000/01/03 00:00", tz="UTC")
 DEFAULT_HTF_ORIGIN_DATE = Timestamp("2000/01/01 00:00", tz="UTC")
+ZERO_TIMEDELTA = Timedelta(0)  # Period of Tick Tables, compared often in loops
 DEFAULT_AGGREGATES = [
     Timedelta("5min"),
     Timedelta("15min"),
@@ -311,6 +312,12 @@ class TimeseriesConfig:
         * False - Only store the ETH Aggregate at HTFs (Calculate RTH at Runtime)
         * None - Store Both the RTH and ETH Aggregate at HTFs
         * 'default' can be passed as a key to override stated default parameter.
+
+    - columnstore_after: Dict[Asset_type:str, pd.Timedelta | None]
+        : When set, newly created Inserted (raw) Aggregate Tables are created with the TimescaleDB
+        columnstore enabled and a policy that converts chunks older than the given age.
+        * Optional, If None is given then the columnstore is not enabled (Default Behavior)
+        * 'default' can be passed as a key to override stated default parameter.
     """
 
     asset_classes: Iterable[str]
@@ -320,6 +327,7 @@ class TimeseriesConfig:
     prioritize_rth: dict[str, bool | None] = field(default_factory=dict)
     calculated_periods: dict[str, list[Timedelta] | None] = field(default_factory=dict)
     stored_periods: dict[str, list[Timedelta] | None] = field(default_factory=dict)
+    columnstore_after: dict[str, Timedelta | None] = field(default_factory=dict)
 
     def __post_init__(self):
         # Get all the desired Defaults from the given input
@@ -339,8 +347,13 @@ class TimeseriesConfig:
 
         _default_raw_aggs = _get_ensured(self.stored_periods, "default", [])
         _default_priority = self.prioritize_rth.get("default", True)
+        _default_columnstore = self.columnstore_after.get("default", None)
 
         for asset_class in self.asset_classes:
+            self.columnstore_after[asset_class] = self.columnstore_after.get(
+                asset_class, _default_columnstore
+            )
+
             asset_aggregates = _get_ensured(
                 self.calculated_periods, asset_class, _default_aggs
             )
@@ -444,6 +457,23 @@ class TimeseriesConfig:
             )
             # endregion
 
+        self._sort_aggregates()
+
+    def _sort_aggregates(self):
+        """
+        Aggregates must be generated lowest period first and removed in the reverse order.
+        Sort once rather than every time the schema is configured. Must be re-run whenever the
+        std, rth, or eth table dictionaries are replaced.
+        """
+        self._sorted_aggs: Dict[str, List[AssetTable]] = {}
+        self._sorted_aggs_desc: Dict[str, List[AssetTable]] = {}
+        for asset_class in self.asset_classes:
+            aggs = self.all_tables(asset_class, include_raw=False)
+            self._sorted_aggs[asset_class] = sorted(aggs, key=lambda x: x.period)
+            self._sorted_aggs_desc[asset_class] = sorted(
+                aggs, key=lambda x: x.period, reverse=True
+            )
+
     def _ext_important(self, asset_class: str) -> bool:
         # private_method, Assume Asset_class is known
         return self.eth_origins[asset_class] != self.rth_origins[asset_class]
@@ -462,6 +492,18 @@ class TimeseriesConfig:
             + self._eth_tables.get(asset_class, [])
         )
 
+    def sorted_aggregates(
+        self, asset_class: str, descending: bool = False
+    ) -> List[AssetTable]:
+        "All calculated aggregates of the asset_class sorted by period."
+        if asset_class not in self.asset_classes:
+            raise KeyError(f"{asset_class = } is not a known asset type.")
+
+        # Copy so callers sorting the result in place can't alter the cached order
+        if descending:
+            return list(self._sorted_aggs_desc[asset_class])
+        return list(self._sorted_aggs[asset_class])
+
     def std_tables(self, asset_class: str, inserted: bool = False) -> List[AssetTable]:
         if asset_class not in self.asset_classes:
             raise KeyError(f"{asset_class = } is not a known asset type.")
@@ -534,9 +576,9 @@ class TimeseriesConfig:
         """
         # Handle the case when requesting tick data separately.
         # Timedelta == 0 interferes with the modulus operation
-        if desired_table.period == Timedelta(0):
+        if desired_table.period == ZERO_TIMEDELTA:
             tbls = self.raw_tables(desired_table.asset_class)
-            divisor_tbls = [tbl for tbl in tbls if tbl.period == Timedelta(0)]
+            divisor_tbls = [tbl for tbl in tbls if tbl.period == ZERO_TIMEDELTA]
             if len(divisor_tbls) == 0:
                 raise AttributeError(
                     "Requesting Tick Data from an Asset Class that has no Tick data"
@@ -548,8 +590,8 @@ class TimeseriesConfig:
             divisor_tbls = [
                 tbl
                 for tbl in tbls
-                if tbl.period == Timedelta(0)
-                or desired_table.period % tbl.period == Timedelta(0)
+                if tbl.period == ZERO_TIMEDELTA
+                or desired_table.period % tbl.period == ZERO_TIMEDELTA
             ]
 
             if len(divisor_tbls) == 0:
@@ -613,12 +655,10 @@ class TimeseriesConfig:
 
     def get_tables_to_refresh(self, altered_table: AssetTable) -> List[AssetTable]:
         "Return all the tables that need to be refreshed for a given table that has been altered"
-        all_aggs = self.all_tables(altered_table.asset_class, include_raw=False)
+        all_aggs = self.sorted_aggregates(altered_table.asset_class)
         # Really this is pretty inefficient and will cause more updates than needed, but I mean,
         # Does it really matter given data will probably be inserted once a day at most? No.
-        filtered_aggs = [agg for agg in all_aggs if agg.period > altered_table.period]
-        filtered_aggs.sort(key=lambda x: x.period)  # Ensure aggregates are ordered.
-        return filtered_aggs
+        return [agg for agg in all_aggs if agg.period > altered_table.period]
 
     @classmethod
     def from_table_names(
@@ -686,6 +726,8 @@ class TimeseriesConfig:
                 table.period for table in cls_tables
             ]
 
+        # Sorted aggregates were cached from the default config by cls(), rebuild them.
+        cls_inst._sort_aggregates()
         return cls_inst
 
 
@@ -718,12 +760,12 @@ def _determine_conflicting_timedeltas(
     std_periods, rth_periods, eth_periods = [], [], []
 
     for period in periods:
-        if period == Timedelta(0):
+        if period == ZERO_TIMEDELTA:
             std_periods.append(period)
             continue
 
         remainder = eth_delta % period
-        if remainder == Timedelta(0):
+        if remainder == ZERO_TIMEDELTA:
             std_periods.append(period)
         elif prioritize_rth:
             rth_periods.append(period)
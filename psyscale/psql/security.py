@@ -137,7 +137,10 @@ def _inner_attrs_select(attrs: Optional[dict[str, Any]] = None) -> sql.Composabl
 
 
 def create_symbol_buffer() -> sql.Composed:
-    "Temp table in injest symbols from. The Source arg is not present since it is assumed constant."
+    """
+    Temp table in injest symbols from. The Source arg is not present since it is assumed constant.
+    Attrs is buffered as TEXT and cast to jsonb on merge.
+    """
     return sql.SQL(
         """
         CREATE TEMP TABLE _symbol_buffer (
@@ -145,7 +148,7 @@ def create_symbol_buffer() -> sql.Composed:
             exchange TEXT NOT NULL,
             asset_class TEXT NOT NULL,
             name TEXT NOT NULL,
-            attrs jsonb
+            attrs TEXT
         ) ON COMMIT DROP;
     """
     ).format(
@@ -155,7 +158,10 @@ def create_symbol_buffer() -> sql.Composed:
 
 
 def copy_symbols(args: list[str]) -> sql.Composed:
-    return sql.SQL("COPY _symbol_buffer ({args}) FROM STDIN;").format(
+    # NULL is sent as '\N' so that empty CSV fields are read as empty strings
+    return sql.SQL(
+        "COPY _symbol_buffer ({args}) FROM STDIN (FORMAT CSV, NULL '\\N');"
+    ).format(
         args=sql.SQL(",").join([sql.Identifier(arg) for arg in args]),
     )
 
@@ -164,7 +170,7 @@ def insert_copied_symbols(source: str) -> sql.Composed:
     return sql.SQL(
         """
         INSERT INTO {schema_name}.{table_name} (source, symbol, name, exchange, asset_class, attrs) 
-        SELECT {source}, symbol, name, exchange, asset_class, attrs FROM _symbol_buffer
+        SELECT {source}, symbol, name, exchange, asset_class, attrs::jsonb FROM _symbol_buffer
         ON CONFLICT (symbol, source, exchange) DO NOTHING
         RETURNING symbol;
     """
@@ -179,7 +185,54 @@ def upsert_copied_symbols(source: str) -> sql.Composed:
     return sql.SQL(
         """
         INSERT INTO {schema_name}.{table_name} (source, symbol, name, exchange, asset_class, attrs) 
-        SELECT {source}, symbol, name, exchange, asset_class, attrs FROM _symbol_buffer
+        SELECT {source}, symbol, name, exchange, asset_class, attrs::jsonb FROM _symbol_buffer
+        ON CONFLICT (symbol, source, exchange)  DO UPDATE
+        SET name = EXCLUDED.name, 
+            asset_class = EXCLUDED.asset_class,
+            attrs = EXCLUDED.attrs
+        RETURNING symbol, xmax;
+    """
+    ).format(
+        schema_name=sql.Identifier(Schema.SECURITY),
+        table_name=sql.Identifier(AssetTbls.SYMBOLS),
+        source=sql.Literal(source),
+    )
+
+
+def _unnest_symbols() -> sql.Composable:
+    "Expands a set of named array placeholders into a table of symbols to insert"
+    cols = ["symbol", "name", "exchange", "asset_class", "attrs"]
+    return sql.SQL("unnest({arrays}) AS _symbols({cols})").format(
+        arrays=sql.SQL(", ").join(
+            sql.SQL("{}::text[]").format(sql.Placeholder(col)) for col in cols
+        ),
+        cols=arg_list(cols),
+    )
+
+
+def insert_symbols(source: str) -> sql.Composed:
+    "Insert symbols passed as column arrays. Params: {symbol, name, exchange, asset_class, attrs}"
+    return sql.SQL(
+        """
+        INSERT INTO {schema_name}.{table_name} (source, symbol, name, exchange, asset_class, attrs) 
+        SELECT {source}, symbol, name, exchange, asset_class, attrs::jsonb FROM {_unnest}
+        ON CONFLICT (symbol, source, exchange) DO NOTHING
+        RETURNING symbol;
+    """
+    ).format(
+        schema_name=sql.Identifier(Schema.SECURITY),
+        table_name=sql.Identifier(AssetTbls.SYMBOLS),
+        source=sql.Literal(source),
+        _unnest=_unnest_symbols(),
+    )
+
+
+def upsert_symbols(source: str) -> sql.Composed:
+    "Upsert symbols passed as column arrays. Params: {symbol, name, exchange, asset_class, attrs}"
+    return sql.SQL(
+        """
+        INSERT INTO {schema_name}.{table_name} (source, symbol, name, exchange, asset_class, attrs) 
+        SELECT {source}, symbol, name, exchange, asset_class, attrs::jsonb FROM {_unnest}
         ON CONFLICT (symbol, source, exchange)  DO UPDATE
         SET name = EXCLUDED.name, 
             asset_class = EXCLUDED.asset_class,
@@ -190,6 +243,7 @@ def upsert_copied_symbols(source: str) -> sql.Composed:
         schema_name=sql.Identifier(Schema.SECURITY),
         table_name=sql.Identifier(AssetTbls.SYMBOLS),
         source=sql.Literal(source),
+        _unnest=_unnest_symbols(),
     )
 
 
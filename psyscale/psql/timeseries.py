@@ -340,7 +340,9 @@ AggregateArgs = Literal[
 AGGREGATE_ARGS = set(v for v in get_args(AggregateArgs))
 
 
-def create_raw_aggregate_table(schema: str, table: AssetTable) -> sql.Composed:
+def create_raw_aggregate_table(
+    schema: str, table: AssetTable, columnstore_after: Optional[Timedelta] = None
+) -> sql.Composed:
     "Aggregate Table that is filled with data from a source API, Should be maintained by the user."
     return sql.SQL(
         """
@@ -361,6 +363,7 @@ def create_raw_aggregate_table(schema: str, table: AssetTable) -> sql.Composed:
         );
         SELECT create_hypertable({full_name}, by_range('dt'));
     """
+        + (_enable_columnstore() if columnstore_after is not None else "")
     ).format(
         schema_name=sql.Identifier(schema),
         table_name=sql.Identifier(repr(table)),
@@ -368,9 +371,23 @@ def create_raw_aggregate_table(schema: str, table: AssetTable) -> sql.Composed:
         # No easy way to make the pkey reference variable
         ref_schema_name=sql.Identifier(Schema.SECURITY),
         ref_table_name=sql.Identifier(AssetTbls.SYMBOLS),
+        after=sql.Literal(columnstore_after),
     )
 
 
+def _enable_columnstore() -> str:
+    # Segmenting by pkey keeps each symbol's data contiguous when converted to the columnstore.
+    # Table is empty on creation so the initial backfill is converted as chunks age.
+    return """
+        ALTER TABLE {schema_name}.{table_name} SET (
+            timescaledb.enable_columnstore = true,
+            timescaledb.segmentby = 'pkey',
+            timescaledb.orderby = 'dt DESC'
+        );
+        CALL add_columnstore_policy({full_name}, after => {after});
+    """
+
+
 def create_continuous_aggrigate(
     schema: str, table: AssetTable, ref_table: AssetTable
 ) -> sql.Composed:
@@ -25,6 +25,11 @@ from .psql import (
 # pylint: disable='protected-access'
 log = logging.getLogger("psyscale_log")
 
+# Upserts with fewer symbols than this skip the COPY buffer table and send a single UNNEST insert.
+UNNEST_UPSERT_LIMIT = 20_000
+# Fixed column order so the generated COPY command is identical between calls.
+REQ_SYMBOL_COLS = ("symbol", "name", "exchange", "asset_class")
+
 
 class SymbolsPartial(PsyscaleCore):
     "Psyscale Symbols Table upsert and search functions"
@@ -106,22 +111,28 @@ class SymbolsPartial(PsyscaleCore):
         if symbols_fmt is None:
             return Series(), Series()
 
+        _op = Op.UPSERT if on_conflict == "update" else Op.INSERT
+
+        response = []  # _cursor() silences Database Errors, leaving this unassigned.
         with self._cursor() as cursor:
-            # Create & Inject the Data into a Temporary Table
-            cursor.execute(self[Op.CREATE, AssetTbls.SYMBOLS_BUFFER]())
-            copy_cmd = self[Op.COPY, AssetTbls.SYMBOLS_BUFFER](
-                # Sends the COPY Cmd & the order of the Columns of the Dataframe
-                [str(c) for c in symbols_fmt.columns]
-            )
-            with cursor.copy(copy_cmd) as copy:
-                for row in symbols_fmt.itertuples(index=False, name=None):
-                    # Writes each row as a Tuple that matches the Dataframe Column Order
-                    copy.write_row(row)
+            if len(symbols_fmt) < UNNEST_UPSERT_LIMIT:
+                # Small batches are sent as column arrays in a single statement.
+                cursor.execute(
+                    self[_op, AssetTbls.SYMBOLS](source), _symbol_arrays(symbols_fmt)
+                )
+            else:
+                # Create & Inject the Data into a Temporary Table
+                cursor.execute(self[Op.CREATE, AssetTbls.SYMBOLS_BUFFER]())
+                copy_cmd = self[Op.COPY, AssetTbls.SYMBOLS_BUFFER](
+                    # Sends the COPY Cmd & the order of the Columns of the Dataframe
+                    [str(c) for c in symbols_fmt.columns]
+                )
+                with cursor.copy(copy_cmd) as copy:
+                    copy.write(_symbols_csv(symbols_fmt))
 
-            # Merge the Temp Table By inserting / upserting from the Temporary Table
-            _op = Op.UPSERT if on_conflict == "update" else Op.INSERT
-            cursor.execute(self[_op, AssetTbls.SYMBOLS_BUFFER](source))
-            response = DataFrame(cursor.fetchall())
+                # Merge the Temp Table By inserting / upserting from the Temporary Table
+                cursor.execute(self[_op, AssetTbls.SYMBOLS_BUFFER](source))
+            response = cursor.fetchall()
 
         return _pkg_symbols_upsert_response(response, _op)
 
@@ -313,22 +324,28 @@ class AsyncSymbolsPartial(PsyscaleAsyncCore, SymbolsPartial):
         if symbols_fmt is None:
             return Series(), Series()
 
+        _op = Op.UPSERT if on_conflict == "update" else Op.INSERT
+
+        response = []  # _acursor() silences Database Errors, leaving this unassigned.
         async with self._acursor() as cursor:
-            # Create & Inject the Data into a Temporary Table
-            await cursor.execute(self[Op.CREATE, AssetTbls.SYMBOLS_BUFFER]())
-            copy_cmd = self[Op.COPY, AssetTbls.SYMBOLS_BUFFER](
-                # Sends the COPY Cmd & the order of the Columns of the Dataframe
-                [str(c) for c in symbols_fmt.columns]
-            )
-            async with cursor.copy(copy_cmd) as copy:
-                for row in symbols_fmt.itertuples(index=False, name=None):
-                    # Writes each row as a Tuple that matches the Dataframe Column Order
-                    await copy.write_row(row)
+            if len(symbols_fmt) < UNNEST_UPSERT_LIMIT:
+                # Small batches are sent as column arrays in a single statement.
+                await cursor.execute(
+                    self[_op, AssetTbls.SYMBOLS](source), _symbol_arrays(symbols_fmt)
+                )
+            else:
+                # Create & Inject the Data into a Temporary Table
+                await cursor.execute(self[Op.CREATE, AssetTbls.SYMBOLS_BUFFER]())
+                copy_cmd = self[Op.COPY, AssetTbls.SYMBOLS_BUFFER](
+                    # Sends the COPY Cmd & the order of the Columns of the Dataframe
+                    [str(c) for c in symbols_fmt.columns]
+                )
+                async with cursor.copy(copy_cmd) as copy:
+                    await copy.write(_symbols_csv(symbols_fmt))
 
-            # Merge the Temp Table By inserting / upserting from the Temporary Table
-            _op = Op.UPSERT if on_conflict == "update" else Op.INSERT
-            await cursor.execute(self[_op, AssetTbls.SYMBOLS_BUFFER](source))
-            response = DataFrame(await cursor.fetchall())
+                # Merge the Temp Table By inserting / upserting from the Temporary Table
+                await cursor.execute(self[_op, AssetTbls.SYMBOLS_BUFFER](source))
+            response = await cursor.fetchall()
 
         return _pkg_symbols_upsert_response(response, _op)
 
@@ -406,31 +423,64 @@ def _prep_symbols_upsert(symbols: DataFrame, source: str) -> DataFrame | None:
         return
 
     symbols.columns = symbols.columns.str.lower()
-    req_cols = {"symbol", "name", "exchange", "asset_class"}
-    missing_cols = req_cols.difference(symbols.columns)
+    missing_cols = [col for col in REQ_SYMBOL_COLS if col not in symbols.columns]
     if len(missing_cols) != 0:
         log.error("Cannot insert symbols. Dataframe missing Columns: %s", missing_cols)
         return
 
-    # Convert to a format that can be inserted into the database
-    symbols_fmt = symbols[[*req_cols]].copy()
+    # Turn all extra Columns into an attributes json obj. Input column order is retained.
+    extra_cols = [col for col in symbols.columns if col not in REQ_SYMBOL_COLS]
+    if len(extra_cols) == 0:
+        attrs = "{}"
+    else:
+        # Serialize every row in one call, .apply(axis="columns") builds a Series per row.
+        attrs = symbols[extra_cols].to_json(orient="records", lines=True).splitlines()
 
-    # Turn all extra Columns into an attributes json obj.
-    symbols_fmt.loc[:, "attrs"] = symbols[
-        [*set(symbols.columns).difference(req_cols)]
-    ].apply(lambda x: x.to_json(), axis="columns")
+    # Build the insertable format in a single construction rather than a copy + assignment
+    symbols_fmt = DataFrame(
+        {col: symbols[col] for col in REQ_SYMBOL_COLS} | {"attrs": attrs},
+        index=symbols.index,
+    )
 
     return symbols_fmt
 
 
-def _pkg_symbols_upsert_response(response: DataFrame, _op: Op) -> Tuple[Series, Series]:
+def _symbols_csv(symbols_fmt: DataFrame) -> str:
+    """
+    Serialize the symbols into a single CSV block that matches the Dataframe Column Order.
+    Lets pandas format every row at once so the whole block is sent in one COPY write.
+    Missing values are written as the COPY command's NULL string, '\\N'.
+    """
+    return symbols_fmt.to_csv(
+        index=False, header=False, lineterminator="\n", na_rep="\\N"
+    )
+
+
+def _symbol_arrays(symbols_fmt: DataFrame) -> dict[str, list]:
+    """
+    Column arrays keyed by the placeholder names of the UNNEST symbol insert commands.
+    Missing values are sent as None, psycopg cannot dump a list mixing NaN and str.
+    """
+    return {
+        str(col): _nulled(symbols_fmt[col]).tolist() for col in symbols_fmt.columns
+    }
+
+
+def _nulled(column: Series) -> Series:
+    return column.astype(object).where(column.notna(), None)
+
+
+def _pkg_symbols_upsert_response(
+    response: list[tuple], _op: Op
+) -> Tuple[Series, Series]:
     if len(response) == 0:
         return Series(), Series()
 
     if _op == Op.INSERT:
         # All Returned symbols in response were inserted, none updated.
-        return response[0], Series()
+        return Series([row[0] for row in response]), Series()
     else:
         # Second Column is xmax, on insertion this is 0, on update its != 0
-        inserted = response[1] == "0"
-        return response.loc[inserted, 0], response.loc[~inserted, 0]
+        inserted = [symbol for symbol, xmax in response if xmax == "0"]
+        updated = [symbol for symbol, xmax in response if xmax != "0"]
+        return Series(inserted), Series(updated)
@@ -2,14 +2,20 @@
 
 from abc import abstractmethod
 import logging
-from typing import Any, Dict, Iterable, Literal, Optional, get_args
+from typing import Any, Dict, Iterable, Literal, Optional, Sequence, Tuple, TypeAlias
 from itertools import chain
 
 import psycopg as pg
+from psycopg import sql
 from pandas import DataFrame, Timestamp, Timedelta
 
 from psyscale.async_core import PsyscaleAsyncCore
-from psyscale.psql.orm import MetadataArgs, MetadataInfo
+from psyscale.psql.orm import (
+    ZERO_TIMEDELTA,
+    AssetTable,
+    MetadataArgs,
+    MetadataInfo,
+)
 from psyscale.psql.timeseries import AggregateArgs, TickArgs
 
 from .psql import (
@@ -25,6 +31,9 @@ from .core import PsyscaleConnectParams, PsyscaleCore, TupleCursor
 
 log = logging.getLogger("psyscale_log")
 
+# (asset_class, tables to add, raw tables to drop) of a confirmed asset_class update
+AssetUpdate: TypeAlias = Tuple[str, set[AssetTable], list[AssetTable]]
+
 # pylint: disable='missing-function-docstring','unused-argument','protected-access'
 
 
@@ -63,29 +72,37 @@ class TimeseriesPartialAbstract(PsyscaleCore):
         as needed. Deletion of Calculated and Stored information will be confirmed before execution.
         """
 
-        with self._cursor() as cursor:
-            cursor.execute(self[Op.SELECT, GenericTbls.SCHEMA]())
-            schemas = set(get_args(Schema))
+        configs = {
+            schema: config
+            for schema, config in (
+                (Schema.TICK_DATA, tick_tables),
+                (Schema.MINUTE_DATA, minute_tables),
+                (Schema.AGGREGATE_DATA, aggregate_tables),
+            )
+            if config is not None
+        }
 
-            # Check & Create Schemas
-            for schema in schemas.difference({rsp[0] for rsp in cursor.fetchall()}):
+        # Ask for every confirmation before any DDL is sent. Creating series tables locks
+        # security.symbols, that lock must not be held while waiting on input.
+        confirmations = {
+            schema: _confirm_schema_changes(self, schema, config)
+            for schema, config in configs.items()
+        }
+
+        with self._cursor() as cursor:
+            # Check & Create Schemas, Only the missing schema names are returned
+            cursor.execute(self[Op.SELECT, GenericTbls.SCHEMA]([v for v in Schema]))
+            for (schema,) in cursor.fetchall():
                 log.info("Creating Schema '%s'", schema)
                 cursor.execute(self[Op.CREATE, GenericTbls.SCHEMA](schema))
 
-            cursor.connection.commit()
+            # Everything below shares one transaction. _cursor() commits once on exit and
+            # rolls back the entire configuration if any of it fails.
 
             # Create Each Class of Timeseries Table
-            if tick_tables is not None:
-                _configure_timeseries_schema(
-                    self, cursor, Schema.TICK_DATA, tick_tables
-                )
-            if minute_tables is not None:
-                _configure_timeseries_schema(
-                    self, cursor, Schema.MINUTE_DATA, minute_tables
-                )
-            if aggregate_tables is not None:
+            for schema, config in configs.items():
                 _configure_timeseries_schema(
-                    self, cursor, Schema.AGGREGATE_DATA, aggregate_tables
+                    self, cursor, schema, config, *confirmations[schema]
                 )
 
         # Ensure The appropriate timeseries info is stored in the event this class is used
@@ -161,6 +178,11 @@ class TimeseriesPartialAbstract(PsyscaleCore):
         _all: bool = False,
     ) -> list[MetadataInfo]: ...
 
+    @abstractmethod
+    def stored_metadata_bulk(
+        self, pkeys: Sequence[int], *, _all: bool = False
+    ) -> dict[int, list[MetadataInfo]]: ...
+
     @abstractmethod
     def manually_refresh_aggregate_metadata(self): ...
 
@@ -227,38 +249,54 @@ class TimeseriesPartialAsyncAbstract(PsyscaleAsyncCore):
     async def refresh_aggregate_metadata_async(self): ...
 
 
+def _confirm_schema_changes(
+    db: TimeseriesPartialAbstract, schema: Schema, config: TimeseriesConfig
+) -> Tuple[list[AssetUpdate], list[str]]:
+    """
+    CLI Confirmation of every destructive change to a schema's configuration.
+    Returns the confirmed asset updates and the confirmed asset removals.
+    """
+    stored_config = db._table_config[schema]
+    log.info("---- Checking for Assets that need to be Changed in '%s'. ----", schema)
+    updates = _confirm_asset_updates(schema, config, stored_config)
+    log.info("---- Checking for Assets that need to be Removed from '%s'. ----", schema)
+    removals = _confirm_asset_removals(schema, config, stored_config)
+    return updates, removals
+
+
 def _configure_timeseries_schema(
     db: TimeseriesPartialAbstract,
     cursor: TupleCursor,
     schema: Schema,
     config: TimeseriesConfig,
+    confirmed_updates: list[AssetUpdate],
+    confirmed_removals: list[str],
 ):
     "Script to Make Changes to the configuration of stored Timeseries Data"
-    cursor.execute(db[Op.SELECT, GenericTbls.SCHEMA_TABLES](schema))
-    tables: set[str] = {rsp[0] for rsp in cursor.fetchall()}
+    cursor.execute(db[Op.SELECT, GenericTbls.SCHEMA_TABLES](schema, SeriesTbls._ORIGIN))
     log.info("---- ---- ---- Configuring Timeseries Schema '%s' ---- ---- ----", schema)
 
     # Ensure Origins Timestamp Table exists in the schema
-    if SeriesTbls._ORIGIN not in tables:
+    if cursor.fetchone() is None:
         log.info("Creating '%s'.'%s' Table\n", schema, SeriesTbls._ORIGIN)
         cursor.execute(db[Op.CREATE, SeriesTbls._ORIGIN](schema))
     else:
-        tables -= {SeriesTbls._ORIGIN.value}
         log.debug("'%s'.'%s' Table Already Exists\n", schema, SeriesTbls._ORIGIN)
 
     stored_config = db._table_config[schema]
 
     log.info("---- Checking for Assets that need to be added. ----")
     _add_timeseries_asset_classes(db.cmds, cursor, schema, config, stored_config)
-    cursor.connection.commit()
 
-    log.info("---- Checking for Assets that need to be Changed. ----")
-    _update_timeseries_asset_classes(db.cmds, cursor, schema, config, stored_config)
-    cursor.connection.commit()
+    log.info("---- Applying confirmed Asset changes. ----")
+    _update_timeseries_asset_classes(
+        db.cmds, cursor, schema, config, stored_config, confirmed_updates
+    )
 
-    log.info("---- Checking for Assets that need to be Removed. ----")
-    _del_timeseries_asset_classes(db.cmds, cursor, schema, config, stored_config)
-    cursor.connection.commit()
+    log.info("---- Applying confirmed Asset removals. ----")
+    _del_timeseries_asset_classes(
+        db.cmds, cursor, schema, stored_config, confirmed_removals
+    )
 
 
 def _add_timeseries_asset_classes(
@@ -273,6 +311,14 @@ def _add_timeseries_asset_classes(
         log.info("No Asset_classes need to be Added.")
         return
 
+    # Resolve the command functions once rather than per table
+    create_tick = cmds[Op.CREATE, SeriesTbls.TICK]
+    create_raw_agg = cmds[Op.CREATE, SeriesTbls.RAW_AGGREGATE]
+    create_tick_cagg = cmds[Op.CREATE, SeriesTbls.CONTINUOUS_TICK_AGG]
+    create_cagg = cmds[Op.CREATE, SeriesTbls.CONTINUOUS_AGG]
+
+    # DDL for every asset is sent together once all of it has been generated
+    ddl: list[sql.Composed] = []
     for asset in additions:
         log.info("Generating all tables for asset_class: %s", asset)
 
@@ -282,146 +328,166 @@ def _add_timeseries_asset_classes(
             "htf_origin": config.htf_origins[asset],
         }
         log.info("Inserting Origin Timestamps: %s", origin_args)
-        cursor.execute(
-            cmds[Op.INSERT, SeriesTbls._ORIGIN](schema, asset, **origin_args)
-        )
+        ddl.append(cmds[Op.INSERT, SeriesTbls._ORIGIN](schema, asset, **origin_args))
 
         # Generate Raw insertion tables
         for tbl in config.raw_tables(asset):
             log.info("Generating table for: '%s'.'%s'", schema, tbl)
-            tbl_type = (
-                SeriesTbls.TICK
-                if tbl.period == Timedelta(0)
-                else SeriesTbls.RAW_AGGREGATE
-            )
+            if tbl.period == ZERO_TIMEDELTA:
+                ddl.append(create_tick(schema, tbl))
+            else:
+                ddl.append(create_raw_agg(schema, tbl, config.columnstore_after[asset]))
 
-            cursor.execute(cmds[Op.CREATE, tbl_type](schema, tbl))
-
-        # Generate Continuous Aggregates
-        tbls = config.all_tables(asset, include_raw=False)
-        tbls.sort(key=lambda x: x.period)  # Must generate lowest periods first
-        for tbl in tbls:
+        # Generate Continuous Aggregates, Must generate lowest periods first
+        for tbl in config.sorted_aggregates(asset):
             log.info("Generating Continuous Aggregate for: '%s'.'%s'", schema, tbl)
             ref_table = config.get_aggregation_source(tbl)
-            tbl_type = (
-                SeriesTbls.CONTINUOUS_TICK_AGG
-                if ref_table.period == Timedelta(0)
-                else SeriesTbls.CONTINUOUS_AGG
+            create_agg = (
+                create_tick_cagg if ref_table.period == ZERO_TIMEDELTA else create_cagg
             )
-            cursor.execute(cmd := cmds[Op.CREATE, tbl_type](schema, tbl, ref_table))
+            ddl.append(cmd := create_agg(schema, tbl, ref_table))
             log.debug("CMD: %s", cmd.as_string())
 
+    _execute_ddl(cursor, ddl)
 
-def _update_timeseries_asset_classes(
-    cmds: Commands,
-    cursor: TupleCursor,
-    schema: Schema,
-    config: TimeseriesConfig,
-    stored_config: TimeseriesConfig,
-):
+
+def _confirm_asset_updates(
+    schema: Schema, config: TimeseriesConfig, stored_config: TimeseriesConfig
+) -> list[AssetUpdate]:
+    "Ask for confirmation of every changed asset_class. Returns the confirmed updates."
     asset_updates = set(config.asset_classes).intersection(stored_config.asset_classes)
     if len(asset_updates) == 0:
         log.info("No Asset_classes need to be Updated.")
-        return
+        return []
 
+    confirmed_updates = []
     for asset in asset_updates:
-        removals = set(stored_config.all_tables(asset)).difference(
-            config.all_tables(asset)
-        )
-
-        additions = set(config.all_tables(asset)).difference(
-            stored_config.all_tables(asset)
-        )
+        cur_tables = config.all_tables(asset)
+        prev_tables = stored_config.all_tables(asset)
+        removals = set(prev_tables).difference(cur_tables)
+        additions = set(cur_tables).difference(prev_tables)
 
         if len(removals) == 0 and len(additions) == 0:
             log.info("No changes needed for asset_class: %s", asset)
             continue
 
-        _del = input(
-            f"Aggregated Data Table Changes exist for Asset_class: '{schema}'.'{asset}'\n"
-            "Updating these changes requires all Calculated Aggregates to be removed and "
-            "recalculated.\n-- All Inserted data *will* be retained --\n"
-            "Update Config? y/[N] : "
-        )
-        if not (_del == "y" or _del == "Y"):
+        raw_removals = [tbl for tbl in removals if tbl.raw]
+        drop_raw = _prompt_asset_update(schema, asset, raw_removals)
+        if drop_raw is None:
             continue
 
+        # Technically keeping raw tables introduces a bug but it's too much an edge case
+        # to care atm. If the table is retained it will only be used for data retrieval
+        # after restart. Despite if it is the lowest timeframe and should be used as the
+        # source for all aggregations.
+        raw_drops = raw_removals if drop_raw else []
+        confirmed_updates.append((asset, additions, raw_drops))
+
+    return confirmed_updates
+
+
+def _update_timeseries_asset_classes(
+    cmds: Commands,
+    cursor: TupleCursor,
+    schema: Schema,
+    config: TimeseriesConfig,
+    stored_config: TimeseriesConfig,
+    confirmed_updates: list[AssetUpdate],
+):
+    if len(confirmed_updates) == 0:
+        return
+
+    # Resolve the command functions once rather than per table
+    create_tick = cmds[Op.CREATE, SeriesTbls.TICK]
+    create_raw_agg = cmds[Op.CREATE, SeriesTbls.RAW_AGGREGATE]
+    create_tick_cagg = cmds[Op.CREATE, SeriesTbls.CONTINUOUS_TICK_AGG]
+    create_cagg = cmds[Op.CREATE, SeriesTbls.CONTINUOUS_AGG]
+    drop_view = cmds[Op.DROP, GenericTbls.VIEW]
+    drop_table = cmds[Op.DROP, GenericTbls.TABLE]
+
+    ddl: list[sql.Composed] = []
+    for asset, additions, raw_drops in confirmed_updates:
         origin_args = {
             "rth_origin": config.rth_origins[asset],
             "eth_origin": config.eth_origins[asset],
             "htf_origin": config.htf_origins[asset],
         }
         log.info("Updating Origin Timestamps: %s", origin_args)
-        cursor.execute(
-            cmds[Op.UPDATE, SeriesTbls._ORIGIN](schema, asset, **origin_args)
-        )
+        ddl.append(cmds[Op.UPDATE, SeriesTbls._ORIGIN](schema, asset, **origin_args))
 
         # Remove All Calculated Data Tables
         log.info("Updating config for Asset: %s", asset)
 
         # Must Remove Longest Aggregates first.
-        all_aggregates = stored_config.all_tables(asset, include_raw=False)
-        all_aggregates.sort(key=lambda x: x.period, reverse=True)
-        for tbl in all_aggregates:
+        for tbl in stored_config.sorted_aggregates(asset, descending=True):
             log.info("Dropping Table: %s", tbl.table_name)
-            cursor.execute(cmds[Op.DROP, GenericTbls.VIEW](schema, tbl.table_name))
+            ddl.append(drop_view(schema, tbl.table_name))
 
         # Remove Unwanted Inserted Table Data
-        for tbl in [tbl for tbl in removals if tbl.raw]:
-            _del = input(
-                f"Inserted Data Table '{tbl}' exists in current database, but not in the new "
-                "config.\nThis table contains inserted raw data with an aggregation period of "
-                f"{tbl.period}. \nDelete it? y/[N] : "
-            )
-            # Technically this introduces a bug but it's too much an edge case to care atm.
-            # If the table is retained it will only be used for data retrieval after restart.
-            # Despite if it is the lowest timeframe and should be used as the source for all
-            # aggregations.
-            if not (_del == "y" or _del == "Y"):
-                continue
-
+        for tbl in raw_drops:
             log.info("Dropping Inserted Table: %s", tbl.table_name)
-            cursor.execute(cmds[Op.DROP, GenericTbls.TABLE](schema, tbl.table_name))
+            ddl.append(drop_table(schema, tbl.table_name))
 
         # Create new Raw Tables
         for tbl in [tbl for tbl in additions if tbl.raw]:
             log.info("Generating table for: '%s'.'%s'", schema, tbl)
-            tbl_type = (
-                SeriesTbls.TICK
-                if tbl.period == Timedelta(0)
-                else SeriesTbls.RAW_AGGREGATE
-            )
-
-            cursor.execute(cmds[Op.CREATE, tbl_type](schema, tbl))
+            if tbl.period == ZERO_TIMEDELTA:
+                ddl.append(create_tick(schema, tbl))
+            else:
+                ddl.append(create_raw_agg(schema, tbl, config.columnstore_after[asset]))
 
-        # Generate Continuous Aggregates
-        tbls = config.all_tables(asset, include_raw=False)
-        tbls.sort(key=lambda x: x.period)  # Must generate lowest periods first
-        for tbl in tbls:
+        # Generate Continuous Aggregates, Must generate lowest periods first
+        for tbl in config.sorted_aggregates(asset):
             log.info("Generating Continuous Aggregate for: '%s'.'%s'", schema, tbl)
             ref_table = config.get_aggregation_source(tbl)
-            tbl_type = (
-                SeriesTbls.CONTINUOUS_TICK_AGG
-                if ref_table.period == Timedelta(0)
-                else SeriesTbls.CONTINUOUS_AGG
+            create_agg = (
+                create_tick_cagg if ref_table.period == ZERO_TIMEDELTA else create_cagg
             )
-            cursor.execute(cmd := cmds[Op.CREATE, tbl_type](schema, tbl, ref_table))
+            ddl.append(cmd := create_agg(schema, tbl, ref_table))
             log.debug("CMD: %s", cmd.as_string())
 
+    _execute_ddl(cursor, ddl)
 
-def _del_timeseries_asset_classes(
-    cmds: Commands,
-    cursor: TupleCursor,
-    schema: Schema,
-    config: TimeseriesConfig,
-    stored_config: TimeseriesConfig,
-):
 
+def _prompt_asset_update(
+    schema: Schema, asset: str, raw_removals: list[AssetTable]
+) -> Optional[bool]:
+    """
+    Single CLI confirmation for all the changes to an asset_class. Returns None when the asset
+    should not be updated, otherwise whether the given raw tables should be dropped.
+    """
+    msg = (
+        f"Aggregated Data Table Changes exist for Asset_class: '{schema}'.'{asset}'\n"
+        "Updating these changes requires all Calculated Aggregates to be removed and "
+        "recalculated.\n"
+    )
+    if len(raw_removals) == 0:
+        rsp = input(
+            msg + "-- All Inserted data *will* be retained --\nUpdate Config? y/[N] : "
+        )
+        return False if rsp.lower() == "y" else None
+
+    rsp = input(
+        msg + "The following Inserted Data Tables exist in current database, but not in "
+        f"the new config:\n{[tbl.table_name for tbl in raw_removals]}\n"
+        "Update Config? 'drop' (permanently delete these tables) / "
+        "'keep' (retain these tables) / [N] : "
+    )
+    if rsp.lower() == "drop":
+        return True
+    return False if rsp.lower() == "keep" else None
+
+
+def _confirm_asset_removals(
+    schema: Schema, config: TimeseriesConfig, stored_config: TimeseriesConfig
+) -> list[str]:
+    "Confirm each asset_class that would be removed. Returns the confirmed asset_classes."
     removals = set(stored_config.asset_classes).difference(config.asset_classes)
     if len(removals) == 0:
         log.info("No Asset_classes need to be removed.")
-        return
+        return []
 
+    confirmed_removals = []
     for asset in removals:
         log.info("Checking if asset_class should be removed: %s", asset)
 
@@ -443,18 +509,49 @@ def _del_timeseries_asset_classes(
             log.info("Keeping asset_class: %s", asset)
             continue
 
+        confirmed_removals.append(asset)
+
+    return confirmed_removals
+
+
+def _del_timeseries_asset_classes(
+    cmds: Commands,
+    cursor: TupleCursor,
+    schema: Schema,
+    stored_config: TimeseriesConfig,
+    confirmed_removals: list[str],
+):
+    # Catch all Table Types for Generic Drop Commands, Will Cascade
+    drop_view = cmds[Op.DROP, GenericTbls.VIEW]
+    drop_table = cmds[Op.DROP, GenericTbls.TABLE]
+
+    ddl: list[sql.Composed] = []
+    for asset in confirmed_removals:
         log.info("Removing Asset Class: %s", asset)
-        cursor.execute(cmds[Op.DELETE, SeriesTbls._ORIGIN](schema, asset))
+        ddl.append(cmds[Op.DELETE, SeriesTbls._ORIGIN](schema, asset))
 
         # Must delete Largest Aggregates First
         tbls = stored_config.all_tables(asset)
         tbls.sort(key=lambda x: x.period, reverse=True)
         for tbl in tbls:
-            # Catch all Table Type for Generic Drop Commands, Will Cascade
-            tbl_type = GenericTbls.TABLE if tbl.raw else GenericTbls.VIEW
-            cursor.execute(cmd := cmds[Op.DROP, tbl_type](schema, tbl.table_name))
+            drop_tbl = drop_table if tbl.raw else drop_view
+            ddl.append(cmd := drop_tbl(schema, tbl.table_name))
             log.debug(cmd.as_string())
 
+    _execute_ddl(cursor, ddl)
+
+
+def _execute_ddl(cursor: TupleCursor, ddl: list[sql.Composed]):
+    """
+    Send a list of DDL Commands to the database as a single multi-statement query.
+    Saves a round trip per table. Commits are still left to the caller.
+    """
+    if len(ddl) == 0:
+        return
+    # Not every command is ';' terminated. Empty statements, i.e. ';;', are valid.
+    # DDL can't be server side prepared, skip psycopg's prepared statement bookkeeping.
+    cursor.execute(sql.SQL(";\n").join(ddl), prepare=False)
+
 
 # pylint: disable='wrong-import-position'
 # At EOF import the Partials that are built on the above abstract classes
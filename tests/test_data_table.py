@@ -112,6 +112,12 @@ def test_01_metadata_fetch(psyscale_db: PsyscaleDB):
     assert metadata.start_date == pd.Timestamp("1800-01-01", tz="UTC")
     assert metadata.timeframe == pd.Timedelta("1min")
 
+    # Bulk fetch should match the per-symbol fetch, unknown pkeys map to nothing
+    bulk_metadata = psyscale_db.stored_metadata_bulk([aapl_pkey, -1])
+    assert bulk_metadata == {aapl_pkey: [], -1: []}
+    bulk_metadata = psyscale_db.stored_metadata_bulk([aapl_pkey, -1], _all=True)
+    assert bulk_metadata == {aapl_pkey: [metadata], -1: []}
+
 
 # region ---- ---- Aggregate Data Tests ---- ----
 
@@ -169,6 +175,8 @@ def test_03_check_inserted_data(psyscale_db: PsyscaleDB, caplog):
     # check what's available
     metadata = psyscale_db.stored_metadata(aapl["pkey"])
     assert len(metadata) == 4  # One for inserted data, 3 more for the aggregates
+    bulk_metadata = psyscale_db.stored_metadata_bulk([aapl["pkey"]])[aapl["pkey"]]
+    assert len(bulk_metadata) == 4 and all(m in metadata for m in bulk_metadata)
 
     minute_metadata = [m for m in metadata if m.timeframe == pd.Timedelta("1min")][0]
 
@@ -476,3 +484,17 @@ def test_10_calculated_tick_aggregates(psyscale_db: PsyscaleDB):
     df["dt"] = pd.to_datetime(df["dt"])
     # fmt: on
     assert_frame_equal(stored_data, df)
+
+
+def test_11_bulk_metadata_not_stored(psyscale_db: PsyscaleDB):
+    aapl = psyscale_db.search_symbols({"store_minute": True})[0]
+    pkey = aapl["pkey"]
+    psyscale_db.update_symbol(pkey, {"store_minute": False})
+
+    try:
+        # Data is still stored, but the symbol is no longer set to be stored
+        assert len(psyscale_db.stored_metadata_bulk([pkey])[pkey]) == 4
+        assert psyscale_db.stored_metadata(pkey, _all=True) == []
+        assert psyscale_db.stored_metadata_bulk([pkey], _all=True) == {pkey: []}
+    finally:
+        psyscale_db.update_symbol(pkey, {"store_minute": True})
@@ -8,6 +8,8 @@ from psyscale.psql.generic import (
     arg_list,
     update_args,
     filter_composer,
+    list_schemas,
+    list_tables,
 )
 
 
@@ -80,3 +82,18 @@ def test_filter_composer_literals():
     filters = [("a", "!=", 1), ("b", "=", 2)]
     result = filter_composer(filters, mode="OR").as_string()  # type: ignore
     assert result == '"a"!=1 OR "b"=2'
+
+
+def test_list_schemas_missing():
+    stmt = list_schemas(only_missing_of=["a", "b"]).as_string()
+    assert stmt == (
+        "SELECT _name FROM unnest(ARRAY['a', 'b']::text[]) AS _name "
+        "WHERE _name NOT IN (SELECT schema_name FROM information_schema.schemata);"
+    )
+
+
+def test_list_tables_filtered():
+    stmt = list_tables("a").as_string()
+    assert stmt.endswith("WHERE table_schema = 'a';")
+    stmt = list_tables("a", "b").as_string()
+    assert stmt.endswith("WHERE table_schema = 'a' AND table_name = 'b';")
@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 import pandas as pd
+from psyscale import symbols_partial
 from psyscale.dev import sql, Schema, AssetTbls
 
 # region ---- ---- Test Fixtures ---- ----
@@ -142,6 +144,54 @@ def test_upsert_updates_on_conflict(psyscale_db, clean_symbols_table, symbols_df
     )
 
 
+def test_upsert_through_copy_buffer(
+    psyscale_db, clean_symbols_table, attrs_symbols, monkeypatch
+):
+    # Force the COPY buffer table path that is otherwise only used for large batches
+    monkeypatch.setattr(symbols_partial, "UNNEST_UPSERT_LIMIT", 0)
+
+    inserted, updated = psyscale_db.upsert_securities(attrs_symbols, source="UnitTest")
+    assert set(inserted.tolist()) == {"TEST1", "TEST2"}
+    assert updated.empty
+
+    inserted, updated = psyscale_db.upsert_securities(attrs_symbols, source="UnitTest")
+    assert inserted.empty
+    assert set(updated.tolist()) == {"TEST1", "TEST2"}
+
+    result = psyscale_db.search_symbols(
+        {"symbol": "TEST1"}, return_attrs=True, strict_symbol_search="="
+    )
+    assert result[0]["attrs"] == {"sector": "Technology", "shortable": True}
+
+
+@pytest.mark.parametrize("missing", [None, np.nan])
+@pytest.mark.parametrize("unnest_limit", [symbols_partial.UNNEST_UPSERT_LIMIT, 0])
+def test_upsert_missing_required_value(
+    psyscale_db,
+    clean_symbols_table,
+    symbols_df,
+    monkeypatch,
+    caplog,
+    unnest_limit,
+    missing,
+):
+    # Both the UNNEST and COPY buffer paths must reject a missing name, not store ''
+    monkeypatch.setattr(symbols_partial, "UNNEST_UPSERT_LIMIT", unnest_limit)
+    symbols_df["name"] = symbols_df["name"].astype(object)
+    symbols_df.loc[symbols_df.symbol == "GOOG", "name"] = missing
+
+    inserted, updated = psyscale_db.upsert_securities(symbols_df, source="test_api")
+    assert inserted.empty
+    assert updated.empty
+    assert "violates not-null constraint" in caplog.text
+    assert psyscale_db.search_symbols({"source": "test_api"}) == []
+
+    # Empty strings are still valid values
+    symbols_df.loc[symbols_df.symbol == "GOOG", "name"] = ""
+    inserted, _ = psyscale_db.upsert_securities(symbols_df, source="test_api")
+    assert set(inserted.tolist()) == {"AAPL", "GOOG"}
+
+
 # endregion
 
 # region ---- ---- Test symbol Atters Insert & Search ---- ----
@@ -0,0 +1,36 @@
+from pandas import Timedelta
+
+from psyscale.psql.orm import AssetTable
+from psyscale.psql.timeseries import create_raw_aggregate_table
+
+RAW_TABLE = AssetTable("us_stock", Timedelta("1min"), True, True, None)
+
+
+def test_create_raw_aggregate_table_columnstore():
+    stmt = create_raw_aggregate_table("minute_data", RAW_TABLE, Timedelta("7D"))
+    stmt = " ".join(stmt.as_string().split())
+
+    assert (
+        "SELECT create_hypertable('minute_data.us_stock_60_raw_ext', by_range('dt'));"
+        in stmt
+    )
+    assert (
+        'ALTER TABLE "minute_data"."us_stock_60_raw_ext" SET ( '
+        "timescaledb.enable_columnstore = true, "
+        "timescaledb.segmentby = 'pkey', "
+        "timescaledb.orderby = 'dt DESC' );"
+    ) in stmt
+    assert stmt.endswith(
+        "CALL add_columnstore_policy('minute_data.us_stock_60_raw_ext', "
+        "after => '7 days 00:00:00'::interval);"
+    )
+
+
+def test_create_raw_aggregate_table_no_columnstore():
+    stmt = create_raw_aggregate_table("minute_data", RAW_TABLE)
+    stmt = " ".join(stmt.as_string().split())
+
+    assert stmt.endswith(
+        "SELECT create_hypertable('minute_data.us_stock_60_raw_ext', by_range('dt'));"
+    )
+    assert "columnstore" not in stmt
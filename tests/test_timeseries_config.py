@@ -2,6 +2,7 @@ from pandas import Timedelta, Timestamp
 import pytest
 from psyscale.dev import TimeseriesConfig, DEFAULT_AGGREGATES
 from psyscale.psql.orm import AssetTable, _determine_conflicting_timedeltas
+from psyscale.timeseries_partial import _confirm_asset_updates
 
 # pylint: disable=missing-function-docstring
 STD_ASSET_LIST = ["us_fund", "us_stock", "crypto"]
@@ -309,6 +310,48 @@ def test_get_tables_to_refresh():
     # assert TEST_CONFIG.get_tables_to_refresh(mock_table) == []
 
 
+def test_sorted_aggregates():
+    for asset in STD_ASSET_LIST:
+        aggs = TEST_CONFIG.all_tables(asset, include_raw=False)
+        asc = TEST_CONFIG.sorted_aggregates(asset)
+        desc = TEST_CONFIG.sorted_aggregates(asset, descending=True)
+        assert asc == sorted(aggs, key=lambda x: x.period)
+        assert desc == sorted(aggs, key=lambda x: x.period, reverse=True)
+        assert all(not tbl.raw for tbl in asc)
+
+        # Sorting the result in place must not alter the cached order
+        asc.sort(key=lambda x: x.period, reverse=True)
+        assert TEST_CONFIG.sorted_aggregates(asset) == sorted(
+            aggs, key=lambda x: x.period
+        )
+
+    with pytest.raises(KeyError):
+        TEST_CONFIG.sorted_aggregates("bonds")
+
+    # Configs rebuilt from the database must sort the stored aggregates, not the defaults
+    reconstruct = TimeseriesConfig.from_table_names(
+        ["us_stock_60_raw", "us_stock_10800", "us_stock_3600"]
+    )
+    asc = [tbl.table_name for tbl in reconstruct.sorted_aggregates("us_stock")]
+    assert asc == ["us_stock_3600", "us_stock_10800"]
+    desc = reconstruct.sorted_aggregates("us_stock", descending=True)
+    assert [tbl.table_name for tbl in desc] == ["us_stock_10800", "us_stock_3600"]
+    refresh = reconstruct.get_tables_to_refresh(reconstruct.raw_tables("us_stock")[0])
+    assert [tbl.table_name for tbl in refresh] == asc
+
+
+def test_columnstore_after_defaults():
+    assert all(TEST_CONFIG.columnstore_after[a] is None for a in STD_ASSET_LIST)
+
+    config = TimeseriesConfig(
+        STD_ASSET_LIST,  # type:ignore
+        columnstore_after={"default": Timedelta("7D"), "crypto": None},
+    )
+    assert config.columnstore_after["us_stock"] == Timedelta("7D")
+    assert config.columnstore_after["us_fund"] == Timedelta("7D")
+    assert config.columnstore_after["crypto"] is None
+
+
 def test_config_from_table_names():
 
     # Shuffled Table names from the TEST_CONFIG definition from above
@@ -356,6 +399,71 @@ def test_config_from_table_names():
 # endregion
 
 
+# region ---- ---- Config Update Confirmation  ---- ----
+
+STORED_CONFIG = TimeseriesConfig.from_table_names(["us_stock_60_raw", "us_stock_3600"])
+UPDATED_CONFIG = TimeseriesConfig(
+    ["us_stock"],  # type:ignore
+    stored_periods={"default": [Timedelta("5min")]},
+    calculated_periods={"default": [Timedelta("1h")]},
+)
+
+
+@pytest.mark.parametrize(
+    "rsp, raw_drops",
+    [
+        ("drop", ["us_stock_60_raw"]),
+        ("KEEP", []),
+        ("n", None),
+        ("", None),
+        ("all", None),  # Previously meant 'drop', must not delete anything now
+    ],
+)
+def test_confirm_asset_updates_raw_removals(monkeypatch, rsp, raw_drops):
+    prompts = []
+    monkeypatch.setattr("builtins.input", lambda msg: prompts.append(msg) or rsp)
+
+    updates = _confirm_asset_updates("minute_data", UPDATED_CONFIG, STORED_CONFIG)
+
+    assert len(prompts) == 1  # One prompt per asset, including the raw table removals
+    assert "us_stock_60_raw" in prompts[0]
+    if raw_drops is None:
+        assert updates == []
+        return
+
+    [(asset, additions, drops)] = updates
+    assert asset == "us_stock"
+    assert [tbl.table_name for tbl in drops] == raw_drops
+    assert {tbl.table_name for tbl in additions if tbl.raw} == {"us_stock_300_raw"}
+
+
+@pytest.mark.parametrize("rsp, updated", [("y", True), ("N", False), ("", False)])
+def test_confirm_asset_updates_aggregates_only(monkeypatch, rsp, updated):
+    stored = TimeseriesConfig.from_table_names(["us_stock_60_raw", "us_stock_14400"])
+    new = TimeseriesConfig(
+        ["us_stock"],  # type:ignore
+        stored_periods={"default": [Timedelta("1min")]},
+        calculated_periods={"default": [Timedelta("1h")]},
+    )
+    monkeypatch.setattr("builtins.input", lambda msg: rsp)
+
+    updates = _confirm_asset_updates("minute_data", new, stored)
+    if not updated:
+        assert updates == []
+        return
+
+    [(asset, additions, drops)] = updates
+    assert asset == "us_stock" and drops == []
+    assert {tbl.table_name for tbl in additions} == {"us_stock_3600"}
+
+    # No changes, no prompt
+    monkeypatch.setattr("builtins.input", lambda msg: pytest.fail("Unexpected prompt"))
+    assert _confirm_asset_updates("minute_data", stored, stored) == []
+
+
+# endregion
+
+
 # region ---- ---- Conflicting time-delta tests  ---- ----
 
 